@@ -0,0 +1,204 @@
+import argparse
+import json
+import sys
+import time
+
+from . import baseline, bench, generate, runner
+
+
+def positive_int(s):
+    n = int(s)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {s}")
+    return n
+
+
+def non_negative_int(s):
+    n = int(s)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {s}")
+    return n
+
+
+def open_cache(args, name="parsed"):
+    if not getattr(args, "cache" if name == "parsed" else "cache_results"):
+        return None
+    from .cache import CACHE_DIR, DiskCache
+    return DiskCache(CACHE_DIR / name, max_bytes=args.cache_size * 2**20)
+
+
+def non_negative_float(s):
+    x = float(s)
+    if x < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {s}")
+    return x
+
+
+def cmd_run(args):
+    days = args.days or runner.find_days()
+    if args.input and len(days) != 1:
+        sys.exit("--input requires exactly one day")
+    if args.mmap:
+        from .loader import MMAP_DAYS
+        days = args.days or sorted(MMAP_DAYS)
+        if not MMAP_DAYS.issuperset(days):
+            sys.exit(f"--mmap only works for days {', '.join(map(str, sorted(MMAP_DAYS)))}")
+
+    cache = open_cache(args)
+    options = dict(
+        path=args.input,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        memory=not args.no_memory,
+        cache=cache,
+        results=open_cache(args, "results"),
+        mmap=args.mmap,
+        extra=[name for name in runner.EXTRA_PASSES if getattr(args, name)],
+    )
+    start = time.perf_counter()
+    if args.jobs:
+        results = runner.run_days_parallel(days, jobs=args.jobs, **options)
+    else:
+        results = [runner.run_day(day, **options) for day in days]
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        print(runner.format_results(results))
+        print(f"total: {elapsed:.2f} s")
+        details = runner.format_details(results)
+        if details:
+            print()
+            print(details)
+
+
+def cmd_check(args):
+    days = args.days or runner.find_days()
+    for day in days:
+        runner.load_day(day).check()
+        print(f"day {day}: ok")
+
+
+def cmd_generate(args):
+    if args.day not in generate.GENERATORS:
+        sys.exit(f"no generator for day {args.day}")
+    text = generate.generate(args.day, args.size, seed=args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+def cmd_bench(args):
+    days = args.days or sorted(bench.LADDERS)
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else None
+    cache = open_cache(args)
+    results = [
+        bench.bench_day(day, sizes=sizes, repeat=args.repeat, memory=not args.no_memory, cache=cache)
+        for day in days
+    ]
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        print(bench.format_results(results))
+
+
+def cmd_baseline_record(args):
+    days = args.days or runner.find_days()
+    baseline.record(days, path=args.file, repeat=args.repeat, ladder=not args.no_ladder)
+    print(f"recorded {len(days)} days in {args.file}")
+
+
+def cmd_baseline_check(args):
+    failures = baseline.check(
+        args.days,
+        path=args.file,
+        repeat=args.repeat,
+        tolerance=args.tolerance,
+        min_time=args.min_time / 1000,
+        ladder=not args.no_ladder,
+    )
+    for failure in failures:
+        print(failure)
+    if failures:
+        sys.exit(1)
+    print("ok")
+
+
+def add_cache_arguments(p):
+    p.add_argument("--cache", action="store_true", help="cache parsed inputs in .cache/parsed")
+    p.add_argument("--cache-size", type=positive_int, default=256, metavar="MB",
+                   help="evict least recently used entries above this size (default: 256)")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser("run", help="run and time solutions")
+    p.add_argument("days", nargs="*", type=int)
+    p.add_argument("--input", help="input file (default: dayN/input.txt)")
+    p.add_argument("--repeat", type=positive_int, default=1)
+    p.add_argument("--warmup", type=non_negative_int, default=0)
+    p.add_argument("--no-memory", action="store_true", help="skip the peak memory pass")
+    p.add_argument("-j", "--jobs", type=positive_int,
+                   help="run every part in its own process, at most JOBS at a time")
+    p.add_argument("--mmap", action="store_true", help="stream the input from a memory map (days 1, 2, 3, 10)")
+    p.add_argument("--profile", action="store_true", help="add a cProfile pass and report the top functions")
+    p.add_argument("--allocations", action="store_true", help="add a tracemalloc pass and report the top allocation sites")
+    p.add_argument("--instrument", action="store_true", help="add a pass with the solvers' counters and timers enabled")
+    p.add_argument("--json", action="store_true", help="write results as JSON")
+    add_cache_arguments(p)
+    p.add_argument("--cache-results", action="store_true",
+                   help="reuse answers from .cache/results if neither input nor solver changed")
+    p.set_defaults(func=cmd_run)
+
+    p = subparsers.add_parser("check", help="run the self-tests on the puzzle examples")
+    p.add_argument("days", nargs="*", type=int)
+    p.set_defaults(func=cmd_check)
+
+    p = subparsers.add_parser("generate", help="write a synthetic input")
+    p.add_argument("day", type=int)
+    p.add_argument("size", type=positive_int)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("-o", "--output", help="output file (default: stdout)")
+    p.set_defaults(func=cmd_generate)
+
+    p = subparsers.add_parser("bench", help="time solutions over generated inputs of growing size")
+    p.add_argument("days", nargs="*", type=int)
+    p.add_argument("--sizes", help="comma separated sizes (default: per-day ladder)")
+    p.add_argument("--repeat", type=positive_int, default=1)
+    p.add_argument("--no-memory", action="store_true", help="skip the peak memory pass")
+    p.add_argument("--json", action="store_true", help="write results as JSON")
+    add_cache_arguments(p)
+    p.set_defaults(func=cmd_bench)
+
+    p = subparsers.add_parser("baseline", help="record or check answers and timings against a baseline")
+    baseline_parsers = p.add_subparsers(dest="baseline_command", required=True)
+    for name, func, help in (
+        ("record", cmd_baseline_record, "store answers and timings"),
+        ("check", cmd_baseline_check, "fail if an answer changed or a phase got slower"),
+    ):
+        b = baseline_parsers.add_parser(name, help=help)
+        b.add_argument("days", nargs="*", type=int)
+        b.add_argument("--file", default=baseline.BASELINE_FILE, help="baseline file (default: baselines.json)")
+        b.add_argument("--repeat", type=positive_int, default=3, help="best of N runs (default: 3)")
+        b.add_argument("--no-ladder", action="store_true", help="only use the puzzle inputs, not the benchmark sizes")
+        b.set_defaults(func=func)
+        if name == "check":
+            b.add_argument("--tolerance", type=non_negative_float, default=0.25,
+                           help="allowed slowdown as a fraction of the baseline (default: 0.25)")
+            b.add_argument("--min-time", type=non_negative_float, default=5, metavar="MS",
+                           help="ignore slowdowns of phases faster than this (default: 5)")
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
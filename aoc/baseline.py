@@ -0,0 +1,73 @@
+import json
+import platform
+
+from . import bench, runner
+
+BASELINE_FILE = runner.ROOT / "baselines.json"
+
+
+def collect(days, repeat=3, ladder=True):
+    # Answers and best wall times per day, input ("input" for the puzzle
+    # input, otherwise the generated size) and phase
+    entries = {}
+    for day in days:
+        entry = {}
+        result = runner.run_day(day, repeat=repeat, memory=False)
+        entry["input"] = phase_entries(result["phases"])
+        if ladder and day in bench.LADDERS:
+            for row in bench.bench_day(day, repeat=repeat, memory=False)["sizes"]:
+                entry[str(row["size"])] = phase_entries(row["phases"])
+        entries[str(day)] = entry
+    return entries
+
+
+def phase_entries(phases):
+    entries = {}
+    for phase, stats in phases.items():
+        entries[phase] = {"wall": stats["wall"]["min"]}
+        if "answer" in stats:
+            entries[phase]["answer"] = stats["answer"]
+    return entries
+
+
+def record(days, path=BASELINE_FILE, repeat=3, ladder=True):
+    baseline = {"machine": platform.node(), "python": platform.python_version(), "days": {}}
+    try:
+        with open(path) as f:
+            baseline["days"] = json.load(f)["days"]
+    except FileNotFoundError:
+        pass
+    baseline["days"].update(collect(days, repeat=repeat, ladder=ladder))
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return baseline
+
+
+def check(days=None, path=BASELINE_FILE, repeat=3, tolerance=0.25, min_time=0.005, ladder=True):
+    with open(path) as f:
+        expected = json.load(f)["days"]
+    days = days or sorted(map(int, expected))
+    missing = [day for day in days if str(day) not in expected]
+    failures = [f"day {day}: no baseline" for day in missing]
+    days = [day for day in days if day not in missing]
+    # Only check sizes that were recorded, and only run the ladder if any were
+    ladder = ladder and any(len(expected[str(day)]) > 1 for day in days)
+    # JSON turns answers into their JSON equivalents, so compare like with like
+    actual = json.loads(json.dumps(collect(days, repeat=repeat, ladder=ladder)))
+
+    for day in days:
+        for size, phases in expected[str(day)].items():
+            if size not in actual[str(day)]:
+                continue
+            for phase, want in phases.items():
+                got = actual[str(day)][size][phase]
+                where = f"day {day} {phase} ({size})"
+                if "answer" in want and got.get("answer") != want["answer"]:
+                    failures.append(f"{where}: answer changed from {want['answer']!r} to {got.get('answer')!r}")
+                limit = want["wall"] * (1 + tolerance)
+                # Very short phases are mostly noise
+                if got["wall"] > limit and got["wall"] > min_time:
+                    failures.append("{}: {:.2f} ms, baseline {:.2f} ms (+{:.0%})".format(
+                        where, got["wall"] * 1000, want["wall"] * 1000, got["wall"] / want["wall"] - 1))
+    return failures
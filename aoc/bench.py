@@ -0,0 +1,131 @@
+import math
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from . import generate, runner
+
+LADDERS = {
+    1: [10_000, 40_000, 160_000],
+    2: [10_000, 40_000, 160_000],
+    3: [1_000, 4_000, 16_000],
+    4: [25, 50, 100, 200],
+    5: [100, 200, 400, 800],
+    6: [1_000, 10_000, 100_000],
+    7: [250, 500, 1_000, 2_000],
+    8: [250, 1_000, 4_000],
+    9: [50, 100, 200],
+    10: [250, 1_000, 4_000],
+    11: [10, 20, 40],
+    12: [6, 8, 10, 12, 14],
+    13: [250, 1_000, 4_000],
+    14: [100, 1_000, 10_000],
+    15: [25, 50, 100],
+    16: [100, 1_000, 10_000],
+    18: [10, 20, 40],
+}
+
+# Generated day 11 grids need not synchronise at all
+SYNC_LIMIT = 1000
+
+
+def find_sync_point_capped(module, grid):
+    try:
+        return module.find_sync_point(grid, limit=SYNC_LIMIT)
+    except RuntimeError:
+        return None
+
+
+OVERRIDES = {
+    11: {"part2": find_sync_point_capped},
+}
+
+
+def solver(day, cache=None):
+    module = runner.load_day(day)
+    read_input = module.read_input
+    if cache is not None:
+        from .cache import cached_parser
+        read_input = cached_parser(module, cache)
+    parts = {phase: getattr(module, phase) for phase in ("part1", "part2")}
+    for phase, func in OVERRIDES.get(day, {}).items():
+        parts[phase] = lambda data, func=func: func(module, data)
+    return SimpleNamespace(read_input=read_input, **parts)
+
+
+IMPORT_SCRIPT = """
+import importlib.util, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("day{day}", {path!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(day, repeat=5):
+    # Measured in a fresh interpreter each time, so nothing the day imports
+    # is already loaded
+    script = IMPORT_SCRIPT.format(day=day, path=str(runner.ROOT / f"day{day}" / f"day{day}.py"))
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+        times.append(float(output))
+    return min(times)
+
+
+def bench_day(day, sizes=None, repeat=1, memory=True, cache=None):
+    module = solver(day, cache=cache)
+    rows = []
+    for size in sizes or LADDERS[day]:
+        text = generate.generate(day, size)
+        samples = {phase: [] for phase in runner.PHASES}
+        answers = {}
+        for _ in range(repeat):
+            for phase, (answer, stats) in runner.run_once(module, text).items():
+                samples[phase].append(stats)
+                answers[phase] = answer
+        peaks = {}
+        if memory:
+            for phase, (_, stats) in runner.run_once(module, text, measure=runner.measure_memory).items():
+                peaks[phase] = stats["peak"]
+        phases = {phase: runner.summarize(samples[phase], peaks.get(phase)) for phase in runner.PHASES}
+        for part in runner.PARTS:
+            phases[part]["answer"] = answers[part]
+        rows.append({"size": size, "bytes": len(text), "phases": phases})
+
+    for prev, row in zip(rows, rows[1:]):
+        for phase, stats in row["phases"].items():
+            before = prev["phases"][phase]
+            stats["time_exponent"] = growth(prev["size"], row["size"], before["wall"]["min"], stats["wall"]["min"])
+            stats["memory_exponent"] = growth(prev["size"], row["size"], before["peak"], stats["peak"])
+
+    return {"day": day, "repeat": repeat, "import": import_time(day), "sizes": rows}
+
+
+def growth(size1, size2, value1, value2):
+    # Slope in log-log space: 1 means linear, 2 quadratic and so on
+    if not value1 or not value2 or size1 == size2:
+        return None
+    return math.log(value2 / value1) / math.log(size2 / size1)
+
+
+def format_results(results):
+    lines = [f"{'day':>5} {'size':>8} {'phase':<6} {'wall (ms)':>10} {'~n^k':>6} {'peak mem':>10} {'~n^k':>6}"]
+    for result in results:
+        lines.append("{:>5} {:>8} {:<6} {:>10.2f}".format(result["day"], "-", "import", result["import"] * 1000))
+        for row in result["sizes"]:
+            for phase, stats in row["phases"].items():
+                lines.append("{:>5} {:>8} {:<6} {:>10.2f} {:>6} {:>10} {:>6}".format(
+                    result["day"],
+                    row["size"],
+                    phase,
+                    stats["wall"]["min"] * 1000,
+                    format_exponent(stats.get("time_exponent")),
+                    runner.format_bytes(stats["peak"]),
+                    format_exponent(stats.get("memory_exponent")),
+                ))
+    return "\n".join(lines)
+
+
+def format_exponent(k):
+    return "-" if k is None else f"{k:.2f}"
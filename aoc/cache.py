@@ -0,0 +1,108 @@
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from .runner import ROOT
+
+CACHE_DIR = ROOT / ".cache"
+
+
+class DiskCache:
+    def __init__(self, directory, max_bytes=256 * 2**20):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key):
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+        # The modification time doubles as the last access time for eviction
+        os.utime(path)
+        return True, value
+
+    def put(self, key, value):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path(key))
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+
+def solver_hash(module):
+    # The day's source plus that of the shared aoc modules it uses, such as
+    # aoc.grid
+    sources = {module.__file__}
+    for value in vars(module).values():
+        used = inspect.getmodule(value)
+        if used is not None and used.__name__.startswith("aoc."):
+            sources.add(used.__file__)
+    digest = hashlib.sha256()
+    for source in sorted(sources):
+        with open(source, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def result_key(day, part, text, version):
+    return hashlib.sha256(f"{day}:{part}:{version}:{text_hash(text)}".encode()).hexdigest()
+
+
+def text_hash(text):
+    # Either a string or a MappedInput, which is hashed without copying
+    data = text.encode() if isinstance(text, str) else text.view()
+    return hashlib.sha256(data).hexdigest()
+
+
+def cached_parser(module, cache):
+    # Parsed objects are instances of classes defined in the day's source or
+    # in shared modules like aoc.grid, so a change to any of them
+    # invalidates the entries
+    version = solver_hash(module)
+
+    def read_input(text):
+        key = hashlib.sha256(f"{module.__name__}:{version}:{text_hash(text)}".encode()).hexdigest()
+        hit, data = cache.get(key)
+        if not hit:
+            data = module.read_input(text)
+            cache.put(key, data)
+        return data
+
+    return read_input
+
+
+def with_parse_cache(module, cache):
+    return SimpleNamespace(
+        read_input=cached_parser(module, cache),
+        part1=module.part1,
+        part2=module.part2,
+    )
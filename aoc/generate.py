@@ -0,0 +1,240 @@
+import random
+
+
+def day1(n, rng):
+    depth = rng.randrange(100, 200)
+    lines = []
+    for _ in range(n):
+        depth = max(0, depth + rng.randrange(-10, 20))
+        lines.append(str(depth))
+    return "\n".join(lines) + "\n"
+
+
+def day2(n, rng):
+    lines = []
+    for _ in range(n):
+        lines.append(f"{rng.choice(('forward', 'down', 'up'))} {rng.randrange(1, 10)}")
+    return "\n".join(lines) + "\n"
+
+
+def day3(n, rng):
+    # The CO2 filter only works if the remaining candidates never all agree
+    # on the next bit, so sample until we find a report where that holds
+    bits = max(12, n.bit_length() + 1)
+
+    def is_valid(report):
+        candidates = report
+        for i in reversed(range(bits)):
+            if len(candidates) == 1:
+                return True
+            ones = [v for v in candidates if v >> i & 1]
+            zeros = [v for v in candidates if not v >> i & 1]
+            if not ones or not zeros:
+                return False
+            candidates = zeros if len(zeros) <= len(ones) else ones
+        return len(candidates) == 1
+
+    report = rng.sample(range(2**bits), n)
+    while not is_valid(report):
+        report = rng.sample(range(2**bits), n)
+    return "\n".join(f"{v:0{bits}b}" for v in report) + "\n"
+
+
+def day4(n, rng):
+    top = max(100, 5 * n)
+    numbers = list(range(top))
+    rng.shuffle(numbers)
+    parts = [",".join(map(str, numbers))]
+    for _ in range(n):
+        cells = rng.sample(range(top), 25)
+        parts.append("\n".join(" ".join(f"{c:2}" for c in cells[i:i+5]) for i in range(0, 25, 5)))
+    return "\n\n".join(parts) + "\n"
+
+
+def day5(n, rng, extent=1000):
+    lines = []
+    for _ in range(n):
+        x1, y1 = rng.randrange(extent), rng.randrange(extent)
+        kind = rng.randrange(3)
+        length = rng.randrange(1, extent // 2)
+        if kind == 0:
+            x2, y2 = x1, min(extent - 1, y1 + length)
+        elif kind == 1:
+            x2, y2 = min(extent - 1, x1 + length), y1
+        else:
+            length = min(length, extent - 1 - x1, extent - 1 - y1)
+            x2, y2 = x1 + length, y1 + length
+            if rng.randrange(2):
+                x1, x2 = x2, x1
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+    return "\n".join(lines) + "\n"
+
+
+def day6(n, rng):
+    return ",".join(str(rng.randrange(1, 6)) for _ in range(n)) + "\n"
+
+
+def day7(n, rng):
+    return ",".join(str(int(rng.expovariate(1 / n))) for _ in range(n)) + "\n"
+
+
+def day8(n, rng):
+    digits = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+    lines = []
+    for _ in range(n):
+        wires = list("abcdefg")
+        rng.shuffle(wires)
+        table = str.maketrans("abcdefg", "".join(wires))
+        patterns = [d.translate(table) for d in digits]
+        rng.shuffle(patterns)
+        outputs = [rng.choice(patterns) for _ in range(4)]
+        lines.append("{} | {}".format(" ".join(patterns), " ".join(outputs)))
+    return "\n".join(lines) + "\n"
+
+
+def digit_grid(n, rng, digits="0123456789", weights=None):
+    return "\n".join("".join(rng.choices(digits, weights, k=n)) for _ in range(n)) + "\n"
+
+
+def day9(n, rng):
+    # Enough 9s to split the map into many small basins
+    return digit_grid(n, rng, weights=[1] * 9 + [7])
+
+
+def day10(n, rng, length=100):
+    pairs = {"(": ")", "[": "]", "{": "}", "<": ">"}
+    lines = []
+    for _ in range(n):
+        stack, line = [], []
+        corrupt = rng.randrange(2)
+        while len(line) < length or (corrupt and not stack):
+            if stack and rng.randrange(2):
+                line.append(pairs[stack.pop()])
+            else:
+                c = rng.choice("([{<")
+                stack.append(c)
+                line.append(c)
+        if corrupt:
+            wrong = [c for c in ")]}>" if c != pairs[stack[-1]]]
+            line.append(rng.choice(wrong))
+        elif not stack:
+            line.append("(")
+        lines.append("".join(line))
+    return "\n".join(lines) + "\n"
+
+
+def day11(n, rng):
+    # Random grids larger than the puzzle's 10x10 usually never synchronise,
+    # so the benchmark caps the number of steps for part 2
+    return digit_grid(n, rng)
+
+
+def day12(n, rng):
+    # The number of paths grows exponentially with the number of caves, so
+    # keep the graph sparse: a ring of small caves with a few chords, plus
+    # some big caves that each connect three small ones. Big caves are never
+    # connected to each other, otherwise there are infinitely many paths.
+    small = ["start", "end"] + [f"c{i}" for i in range(n)]
+    rng.shuffle(small)
+    edges = set(zip(small, small[1:] + small[:1]))
+    for i in range(max(1, n // 4)):
+        for other in rng.sample(small, 3):
+            edges.add((f"B{i}", other))
+    for _ in range(n // 2):
+        a, b = rng.sample(small, 2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+    return "\n".join(f"{a}-{b}" for a, b in sorted(edges)) + "\n"
+
+
+def day13(n, rng, folds=12):
+    width, height = 40, 6
+    fold_lines = []
+    for i in range(folds):
+        if i % 2 == 0:
+            fold_lines.append(("x", width))
+            width = 2 * width + 1
+        else:
+            fold_lines.append(("y", height))
+            height = 2 * height + 1
+
+    points = set()
+    while len(points) < n:
+        x, y = rng.randrange(width), rng.randrange(height)
+        # Fold lines are measured in the coordinates of the sheet at the
+        # time of the fold, so check the point after every earlier fold
+        fx, fy, ok = x, y, True
+        for axis, v in reversed(fold_lines):
+            if axis == "x":
+                ok = ok and fx != v
+                fx = fx if fx < v else 2 * v - fx
+            else:
+                ok = ok and fy != v
+                fy = fy if fy < v else 2 * v - fy
+        if ok:
+            points.add((x, y))
+
+    lines = [f"{x},{y}" for x, y in points]
+    lines.append("")
+    lines.extend(f"fold along {axis}={v}" for axis, v in reversed(fold_lines))
+    return "\n".join(lines) + "\n"
+
+
+def day14(n, rng, elements="BCFHKNOPSV"):
+    template = "".join(rng.choices(elements, k=n))
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements]
+    return template + "\n\n" + "\n".join(rules) + "\n"
+
+
+def day15(n, rng):
+    return digit_grid(n, rng, digits="123456789")
+
+
+def day16(n, rng):
+    def literal(value):
+        groups = f"{value:b}"
+        groups = groups.zfill(-(-len(groups) // 4) * 4)
+        chunks = [groups[i:i+4] for i in range(0, len(groups), 4)]
+        return "".join(("1" if i < len(chunks) - 1 else "0") + c for i, c in enumerate(chunks))
+
+    def packet(budget, depth):
+        version = f"{rng.randrange(8):03b}"
+        if budget <= 1 or depth >= 40:
+            return version + "100" + literal(rng.randrange(16)), 1
+        type_id = rng.choice((0, 1, 2, 3, 5, 6, 7))
+        count = 2 if type_id >= 5 else rng.randrange(1, min(budget, 8) + 1)
+        shares = [max(1, (budget - 1) // count)] * count
+        subpackets, used = [], 1
+        for share in shares:
+            bits, size = packet(share, depth + 1)
+            subpackets.append(bits)
+            used += size
+        body = "".join(subpackets)
+        if len(body) < 2**15 and rng.randrange(2):
+            header = "0" + f"{len(body):015b}"
+        else:
+            header = "1" + f"{len(subpackets):011b}"
+        return version + f"{type_id:03b}" + header + body, used
+
+    bits, _ = packet(n, 0)
+    bits += "0" * (-len(bits) % 4)
+    return "".join(f"{int(bits[i:i+4], 2):X}" for i in range(0, len(bits), 4)) + "\n"
+
+
+def day18(n, rng):
+    def number(depth):
+        if depth == 4 or (depth > 0 and rng.randrange(3) == 0):
+            return str(rng.randrange(10))
+        return f"[{number(depth + 1)},{number(depth + 1)}]"
+
+    return "\n".join(f"[{number(1)},{number(1)}]" for _ in range(n)) + "\n"
+
+
+GENERATORS = {
+    1: day1, 2: day2, 3: day3, 4: day4, 5: day5, 6: day6, 7: day7, 8: day8, 9: day9,
+    10: day10, 11: day11, 12: day12, 13: day13, 14: day14, 15: day15, 16: day16, 18: day18,
+}
+
+
+def generate(day, size, seed=0):
+    return GENERATORS[day](size, random.Random(f"{day}-{size}-{seed}"))
@@ -0,0 +1,67 @@
+from array import array
+
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+class Grid:
+    # Cells are stored row by row in one flat array, surrounded by a one cell
+    # wide border holding `border`. A cell is addressed by its index into the
+    # array, and its neighbours are at fixed offsets from it, so neighbour
+    # lookups need no bounds checks: border cells are simply skipped.
+    def __init__(self, width, height, border=-1, typecode="b"):
+        self.width = width
+        self.height = height
+        self.border = border
+        self.stride = width + 2
+        self.cells = array(typecode, [border]) * (self.stride * (height + 2))
+        s = self.stride
+        self.offsets4 = (-s, 1, s, -1)
+        self.offsets8 = (-s, -s + 1, 1, s + 1, s, s - 1, -1, -s - 1)
+
+    @classmethod
+    def from_digits(cls, s, border=-1):
+        rows = [line.strip() for line in s.splitlines() if line.strip()]
+        grid = cls(len(rows[0]), len(rows), border)
+        for y, row in enumerate(rows):
+            start = grid.index(0, y)
+            grid.cells[start:start + grid.width] = array(grid.cells.typecode, row.encode().translate(DIGITS))
+        return grid
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __getitem__(self, i):
+        return self.cells[i]
+
+    def __setitem__(self, i, value):
+        self.cells[i] = value
+
+    def index(self, x, y):
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, i):
+        y, x = divmod(i, self.stride)
+        return x - 1, y - 1
+
+    def indices(self):
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def row(self, y):
+        start = self.index(0, y)
+        return self.cells[start:start + self.width]
+
+    def neighbours4(self, i):
+        cells, border = self.cells, self.border
+        return [j for j in (i + o for o in self.offsets4) if cells[j] != border]
+
+    def neighbours8(self, i):
+        cells, border = self.cells, self.border
+        return [j for j in (i + o for o in self.offsets8) if cells[j] != border]
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = array(self.cells.typecode, self.cells)
+        return grid
@@ -0,0 +1,66 @@
+import time
+from collections import defaultdict
+from functools import wraps
+
+# Probes are bound when a day module is imported: with instrumentation
+# disabled at that point they are plain no-ops and cost a single call.
+enabled = False
+
+counters = defaultdict(int)
+timers = defaultdict(lambda: [0, 0.0])
+
+
+def noop(n=1):
+    pass
+
+
+def counter(name):
+    if not enabled:
+        return noop
+
+    def count(n=1):
+        counters[name] += n
+
+    return count
+
+
+def timed(name):
+    def decorator(func):
+        if not enabled:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer = timers[name]
+                timer[0] += 1
+                timer[1] += time.perf_counter() - start
+
+        return wrapper
+
+    return decorator
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    counters.clear()
+    timers.clear()
+
+
+def report():
+    return {
+        "counters": dict(sorted(counters.items())),
+        "timers": {name: {"calls": calls, "total": total} for name, (calls, total) in sorted(timers.items())},
+    }
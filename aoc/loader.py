@@ -0,0 +1,41 @@
+import mmap
+
+# Days whose read_input() accepts a MappedInput as well as a string
+MMAP_DAYS = {1, 2, 3, 10}
+
+
+class MappedInput:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.size = self.file.seek(0, 2)
+        # mmap refuses to map empty files
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def view(self):
+        return memoryview(self.map) if self.map is not None else memoryview(b"")
+
+    def iter_views(self):
+        view = self.view()
+        pos = 0
+        while pos < self.size:
+            end = self.map.find(b"\n", pos)
+            if end < 0:
+                end = self.size
+            stop = end - 1 if end > pos and view[end-1] == ord("\r") else end
+            yield view[pos:stop]
+            pos = end + 1
+
+    def splitlines(self):
+        for line in self.iter_views():
+            yield str(line, "utf-8")
@@ -0,0 +1,293 @@
+import cProfile
+import importlib.util
+import os
+import pstats
+import re
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PARTS = ("part1", "part2")
+PHASES = ("parse",) + PARTS
+REPORT_TOP = 15
+
+
+def find_days():
+    days = []
+    for path in ROOT.glob("day*/day*.py"):
+        m = re.fullmatch(r"day(\d+)", path.stem)
+        if m and path.parent.name == path.stem:
+            days.append(int(m.group(1)))
+    return sorted(days)
+
+
+def default_input(day):
+    return ROOT / f"day{day}" / "input.txt"
+
+
+def load_day(day, register=True):
+    path = ROOT / f"day{day}" / f"day{day}.py"
+    spec = importlib.util.spec_from_file_location(f"day{day}", path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so that pickle can find the classes defined in the module
+    if register:
+        sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_instrumented_day(day):
+    from . import instrument
+    instrument.enable()
+    try:
+        return load_day(day, register=False)
+    finally:
+        instrument.disable()
+
+
+def measure(func, *args):
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    result = func(*args)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    return result, {"wall": wall, "cpu": cpu}
+
+
+def measure_memory(func, *args):
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, {"peak": peak}
+
+
+def measure_profile(func, *args):
+    profile = cProfile.Profile()
+    result = profile.runcall(func, *args)
+    entries = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in pstats.Stats(profile).stats.items():
+        entries.append({
+            "function": f"{Path(filename).name}:{line}({name})",
+            "calls": calls,
+            "tottime": tottime,
+            "cumtime": cumtime,
+        })
+    entries.sort(key=lambda e: e["tottime"], reverse=True)
+    return result, {"profile": entries[:REPORT_TOP]}
+
+
+def measure_allocations(func, *args):
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    allocations = []
+    for stat in snapshot.statistics("lineno")[:REPORT_TOP]:
+        frame = stat.traceback[0]
+        allocations.append({
+            "line": f"{Path(frame.filename).name}:{frame.lineno}",
+            "size": stat.size,
+            "count": stat.count,
+        })
+    return result, {"allocations": allocations}
+
+
+def measure_instrumented(func, *args):
+    from . import instrument
+    instrument.reset()
+    result = func(*args)
+    return result, {"instrument": instrument.report()}
+
+
+# Optional diagnostic passes, each run once after the timed runs
+EXTRA_PASSES = {
+    "profile": measure_profile,
+    "allocations": measure_allocations,
+    "instrument": measure_instrumented,
+}
+
+
+def run_once(module, text, measure=measure, parts=PARTS):
+    results = {"parse": measure(module.read_input, text)}
+    for phase in parts:
+        # Parts may modify their input (day 4 marks its boards), so each one
+        # gets a freshly parsed copy
+        data = module.read_input(text)
+        results[phase] = measure(getattr(module, phase), data)
+    return results
+
+
+def run_day(day, path=None, repeat=1, warmup=0, memory=True, cache=None, mmap=False, parts=PARTS, extra=(),
+            results=None):
+    if repeat < 1 or warmup < 0:
+        raise ValueError("repeat must be at least 1 and warmup not negative")
+
+    module = load_day(day)
+    if results is not None:
+        from .cache import solver_hash
+        results = (results, solver_hash(module))
+    if cache is not None:
+        from .cache import with_parse_cache
+        module = with_parse_cache(module, cache)
+    path = Path(path) if path else default_input(day)
+    if mmap:
+        from .loader import MMAP_DAYS, MappedInput
+        if day not in MMAP_DAYS:
+            raise ValueError(f"day {day} can't read memory-mapped input")
+        with MappedInput(path) as text:
+            return run_input(day, module, path, text, repeat, warmup, memory, parts, extra, results)
+    return run_input(day, module, path, path.read_text(), repeat, warmup, memory, parts, extra, results)
+
+
+def run_input(day, module, path, text, repeat, warmup, memory, parts, extra, results=None):
+    # Parts with a cached answer for this input and solver version are not
+    # run at all
+    cached = {}
+    if results is not None:
+        from .cache import result_key
+        cache, version = results
+        for part in parts:
+            hit, answer = cache.get(result_key(day, part, text, version))
+            if hit:
+                cached[part] = {"cached": True, "answer": answer}
+        parts = tuple(part for part in parts if part not in cached)
+
+    result = {
+        "day": day,
+        "input": str(path),
+        "repeat": repeat,
+        "warmup": warmup,
+        "phases": {},
+    }
+    if parts:
+        result["phases"] = measure_input(day, module, text, repeat, warmup, memory, parts, extra)
+        if results is not None:
+            for part in parts:
+                cache.put(result_key(day, part, text, version), result["phases"][part]["answer"])
+    result["phases"].update(cached)
+    result["phases"] = {phase: result["phases"][phase] for phase in PHASES if phase in result["phases"]}
+    return result
+
+
+def measure_input(day, module, text, repeat, warmup, memory, parts, extra):
+    phases = ("parse",) + tuple(parts)
+    for _ in range(warmup):
+        run_once(module, text, parts=parts)
+
+    samples = {phase: [] for phase in phases}
+    answers = {}
+    for _ in range(repeat):
+        for phase, (answer, stats) in run_once(module, text, parts=parts).items():
+            samples[phase].append(stats)
+            answers[phase] = answer
+
+    # Tracing allocations slows everything down considerably, so peak memory
+    # is measured in a separate, untimed pass
+    peaks = {}
+    if memory:
+        for phase, (_, stats) in run_once(module, text, measure=measure_memory, parts=parts).items():
+            peaks[phase] = stats["peak"]
+
+    results = {}
+    for phase in phases:
+        results[phase] = summarize(samples[phase], peaks.get(phase))
+        if phase != "parse":
+            results[phase]["answer"] = answers[phase]
+
+    for name in extra:
+        # Probes are only live in a freshly imported, instrumented copy, so
+        # the timed runs above are unaffected by them
+        pass_module = load_instrumented_day(day) if name == "instrument" else module
+        for phase, (_, stats) in run_once(pass_module, text, measure=EXTRA_PASSES[name], parts=parts).items():
+            results[phase].update(stats)
+
+    return results
+
+
+def run_days_parallel(days, jobs=None, **kwargs):
+    # Every part of every day is a separate task that parses its own input,
+    # so the total time approaches that of the slowest single part
+    tasks = [(day, part) for day in days for part in PARTS]
+    jobs = min(jobs or os.cpu_count() or 1, len(tasks))
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_day, day, parts=(part,), **kwargs) for day, part in tasks]
+        for (day, part), future in zip(tasks, futures):
+            result = future.result()
+            if day in results:
+                results[day]["phases"][part] = result["phases"][part]
+            else:
+                results[day] = result
+    return [results[day] for day in days]
+
+
+def summarize(samples, peak=None):
+    walls = [s["wall"] for s in samples]
+    cpus = [s["cpu"] for s in samples]
+    return {
+        "wall": {"min": min(walls), "mean": sum(walls) / len(walls)},
+        "cpu": {"min": min(cpus), "mean": sum(cpus) / len(cpus)},
+        "peak": peak,
+    }
+
+
+def format_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def format_results(results):
+    lines = [f"{'day':>5} {'phase':<6} {'wall (ms)':>10} {'cpu (ms)':>10} {'peak mem':>10}  answer"]
+    for result in results:
+        for phase, stats in result["phases"].items():
+            answer = stats.get("answer")
+            if isinstance(answer, str) and "\n" in answer:
+                answer = answer.splitlines()[0] + " ..."
+            if stats.get("cached"):
+                lines.append("{:>5} {:<6} {:>10} {:>10} {:>10}  {}".format(
+                    result["day"], phase, "cached", "-", "-", answer))
+                continue
+            lines.append("{:>5} {:<6} {:>10.2f} {:>10.2f} {:>10}  {}".format(
+                result["day"],
+                phase,
+                stats["wall"]["min"] * 1000,
+                stats["cpu"]["min"] * 1000,
+                format_bytes(stats["peak"]),
+                "" if answer is None else answer,
+            ))
+    return "\n".join(lines)
+
+
+def format_details(results):
+    lines = []
+    for result in results:
+        for phase, stats in result["phases"].items():
+            report = stats.get("instrument")
+            if report and (report["counters"] or report["timers"]):
+                lines.append(f"day {result['day']} {phase}: instrumentation")
+                for name, value in report["counters"].items():
+                    lines.append(f"  {name:<32} {value:>12}")
+                for name, timer in report["timers"].items():
+                    lines.append(f"  {name:<32} {timer['calls']:>12} calls {timer['total'] * 1000:>10.2f} ms")
+            if stats.get("profile"):
+                lines.append(f"day {result['day']} {phase}: profile (by own time)")
+                for entry in stats["profile"]:
+                    lines.append("  {:>10} calls {:>10.2f} ms own {:>10.2f} ms cum  {}".format(
+                        entry["calls"], entry["tottime"] * 1000, entry["cumtime"] * 1000, entry["function"]))
+            if stats.get("allocations"):
+                lines.append(f"day {result['day']} {phase}: allocations alive at the end")
+                for entry in stats["allocations"]:
+                    lines.append(f"  {format_bytes(entry['size']):>10} {entry['count']:>10} blocks  {entry['line']}")
+    return "\n".join(lines)
@@ -1,15 +1,94 @@
 #!/usr/bin/env python
+import sys
+from collections import deque
+from functools import partial
+from importlib.util import find_spec
+from itertools import islice
+
+
+def read_input(s):
+    return [int(line) for line in s.splitlines() if line.strip()]
+
+
+def iter_readings(f):
+    for line in f:
+        if line.strip():
+            yield int(line)
+
+
+def iter_window_incr(readings, k=1):
+    # Consecutive windows of size k share k-1 readings, so the later window
+    # has the larger sum exactly when the reading it adds is larger than the
+    # one it drops. Only the last k readings need to be kept.
+    if k < 1:
+        raise ValueError(f"invalid window size: {k}")
+    readings = iter(readings)
+    window = deque(islice(readings, k), maxlen=k)
+    count = 0
+    for reading in readings:
+        if reading > window[0]:
+            count += 1
+        window.append(reading)
+        yield count
+
+
+def count_window_incr(readings, k=1):
+    count = 0
+    for count in iter_window_incr(readings, k):
+        pass
+    return count
+
+
+def load_readings(path):
+    # NumPy is optional and only needed for the array functions
+    import numpy as np
+    return np.fromfile(path, dtype=np.int64, sep=" ")
+
+
+def count_window_incr_array(readings, k=1):
+    import numpy as np
+    if k < 1:
+        raise ValueError(f"invalid window size: {k}")
+    return int(np.count_nonzero(readings[k:] > readings[:-k])) if k < len(readings) else 0
+
+
+def count_file_incr(path, windows=(1, 3)):
+    readings = load_readings(path)
+    return tuple(count_window_incr_array(readings, k) for k in windows)
+
+
+def count_files_incr(paths, windows=(1, 3), workers=None):
+    # One tuple of counts per file, in the order of paths
+    count = partial(count_file_incr, windows=tuple(windows))
+    if not workers:
+        return [count(path) for path in paths]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(count, paths, chunksize=16))
+
 
 def count_incr(measurements):
-    return sum((int(b > a) for a, b in zip(measurements, measurements[1:])))
+    return count_window_incr(measurements, 1)
 
 
 def count_incr_w3(measurements):
-    windows = map(sum, zip(measurements, measurements[1:], measurements[2:]))
-    return count_incr(list(windows))
+    return count_window_incr(measurements, 3)
 
 
-def main():
+def part1(measurements):
+    return count_incr(measurements)
+
+
+def part2(measurements):
+    return count_incr_w3(measurements)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
     measurements = """
     199
     200
@@ -22,18 +101,43 @@ def main():
     260
     263
     """
-    measurements = list(map(int, measurements.split()))
+    measurements = read_input(measurements)
     assert count_incr(measurements) == 7
     assert count_incr_w3(measurements) == 5
+    assert count_window_incr(iter(measurements), 2) == 5
+    assert list(iter_window_incr(measurements[:4], 1)) == [1, 2, 3]
+    assert count_window_incr(measurements, 20) == 0
+
+    if find_spec("numpy"):
+        import numpy as np
+        readings = np.array(measurements)
+        assert count_window_incr_array(readings) == 7
+        assert count_window_incr_array(readings, 3) == 5
+        assert count_window_incr_array(readings, 20) == 0
+
+
+def main():
+    # With arguments, count increases of a stream of readings (use "-" for
+    # stdin) for any window size, e.g. day1.py - 3 < sensor-feed
+    if len(sys.argv) > 1:
+        k = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+        if sys.argv[1] == "-":
+            print(count_window_incr(iter_readings(sys.stdin), k))
+        else:
+            with open(sys.argv[1]) as f:
+                print(count_window_incr(iter_readings(f), k))
+        return
+
+    check()
 
     with open("input.txt") as f:
-        measurements = list(map(int, f))
+        measurements = read_input(f.read())
 
     print("part 1")
-    print(count_incr(measurements))
+    print(part1(measurements))
 
     print("part 2")
-    print(count_incr_w3(measurements))
+    print(part2(measurements))
 
 
 if __name__ == "__main__":
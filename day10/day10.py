@@ -1,5 +1,4 @@
 #!/usr/bin/env python
-from textwrap import dedent
 
 opening = "([{<"
 closing = ")]}>"
@@ -7,6 +6,10 @@ closing = ")]}>"
 scores_part1 = {")": 3, "]": 57, "}": 1197, ">": 25137}
 scores_part2 = {")": 1, "]": 2, "}": 3, ">": 4}
 
+def read_input(s):
+    return list(s.splitlines())
+
+
 def parse_line(line):
     stack = []
     for c in line:
@@ -44,7 +47,21 @@ def get_score_part2(lines):
     return sorted(scores)[len(scores)//2]
 
 
-def main():
+def part1(lines):
+    return get_score_part1(lines)
+
+
+def part2(lines):
+    return get_score_part2(lines)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     assert parse_line("{([(<{}[<>[]}>{[]{[(<()>") == (False, "}", "]")
     assert parse_line("[[<[([]))<([[{}[[()]]]") == (False, ")", "]")
     assert parse_line("[{[{({}]{}}([{[{{{}}([]") == (False, "]", ")")
@@ -65,18 +82,22 @@ def main():
     <{([([[(<>()){}]>(<<{{
     <{([{{}}[<[[[<>{}]]]>[]]
     """)
-    lines = example.splitlines()
+    lines = read_input(example)
     assert get_score_part1(lines) == 26397
     assert get_score_part2(lines) == 288957
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
-        lines = f.read().splitlines()
+        lines = read_input(f.read())
 
     print("part 1")
-    print(get_score_part1(lines))
+    print(part1(lines))
 
     print("part 2")
-    print(get_score_part2(lines))
+    print(part2(lines))
 
 
 if __name__ == "__main__":
@@ -1,46 +1,60 @@
 #!/usr/bin/env python
-from textwrap import dedent
+import os
+import sys
 
-def read_input(s):
-    grid = {}
-    for y, line in enumerate(s.splitlines()):
-        for x, c in enumerate(line):
-            grid[(x, y)] = int(c)
-    return grid
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from aoc import instrument
+from aoc.grid import Grid
+
+flash_calls = instrument.counter("day11.flash")
 
 
-def flash(grid, coords, flashed):
-    flashed.add(coords)
-    x, y = coords
-    for dx, dy in ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)):
-        neighbour = (x + dx, y + dy)
-        if neighbour not in grid:
-            continue
-        grid[neighbour] += 1
-        if grid[neighbour] > 9 and neighbour not in flashed:
-            flash(grid, neighbour, flashed)
+def read_input(s):
+    return Grid.from_digits(s)
+
+
+def flash(grid, i, flashed, order):
+    # Iterative rather than recursive, so large grids can't hit the
+    # recursion limit
+    cells, border, offsets = grid.cells, grid.border, grid.offsets8
+    flashed[i] = 1
+    stack = [i]
+    while stack:
+        i = stack.pop()
+        flash_calls()
+        order.append(i)
+        for o in offsets:
+            neighbour = i + o
+            if cells[neighbour] == border:
+                continue
+            cells[neighbour] += 1
+            if cells[neighbour] > 9 and not flashed[neighbour]:
+                flashed[neighbour] = 1
+                stack.append(neighbour)
 
 
+@instrument.timed("day11.step")
 def step(grid):
-    flashed = set()
-    for coords in grid:
-        grid[coords] += 1
-    for coords in grid:
-        if grid[coords] > 9 and coords not in flashed:
-            flash(grid, coords, flashed)
-    for coords in flashed:
-        grid[coords] = 0
-    return len(flashed)
+    cells = grid.cells
+    flashed = bytearray(len(cells))
+    order = []
+    for i in grid.indices():
+        cells[i] += 1
+    for i in grid.indices():
+        if cells[i] > 9 and not flashed[i]:
+            flash(grid, i, flashed, order)
+    for i in order:
+        cells[i] = 0
+    return len(order)
 
 
 def format_grid(grid):
     parts = []
-    for y in range(10):
-        for x in range(10):
-            coords = (x, y)
-            if coords not in grid:
-                continue
-            parts.append(" {}{}".format(grid[coords], "*" if grid[coords] == 0 else " "))
+    for y in range(grid.height):
+        for value in grid.row(y):
+            parts.append(" {}{}".format(value, "*" if value == 0 else " "))
         parts.append("\n")
     return "".join(parts)
 
@@ -53,17 +67,32 @@ def simulate_steps(grid, n):
     return total
 
 
-def find_sync_point(grid):
+def find_sync_point(grid, limit=None):
     _grid = grid.copy()
     i = 0
-    while True:
+    while limit is None or i < limit:
         i += 1
         count = step(_grid)
         if count == len(_grid):
             return i
+    raise RuntimeError("no sync point")
 
 
-def main():
+def part1(grid):
+    return simulate_steps(grid, 100)
+
+
+def part2(grid):
+    return find_sync_point(grid)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""\
     5483143223
     2745854711
@@ -80,14 +109,18 @@ def main():
     assert simulate_steps(grid, 10) == 204
     assert simulate_steps(grid, 100) == 1656
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
         grid = read_input(f.read())
 
     print("part 1")
-    print(simulate_steps(grid, 100))
+    print(part1(grid))
 
     print("part 2")
-    print(find_sync_point(grid))
+    print(part2(grid))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,16 @@
 #!/usr/bin/env python
+import os
+import sys
 from collections import defaultdict
-from textwrap import dedent
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from aoc import instrument
+
+find_paths_calls = instrument.counter("day12.find_paths")
+paths_found = instrument.counter("day12.paths")
+
 
 def read_input(s):
     graph = defaultdict(list)
@@ -12,6 +22,7 @@ def read_input(s):
 
 
 def find_paths(graph, path=None, result=None, allow_duplicate=False):
+    find_paths_calls()
     path = path or ["start"]
     result = result if result is not None else []
     node = path[-1]
@@ -23,13 +34,28 @@ def find_paths(graph, path=None, result=None, allow_duplicate=False):
             if candidate not in ("start", "end") and allow_duplicate:
                 find_paths(graph, new_path, result, allow_duplicate=False)
         elif candidate == "end":
+            paths_found()
             result.append(new_path)
         else:
             find_paths(graph, new_path, result, allow_duplicate)
     return result
 
 
-def main():
+def part1(graph):
+    return len(find_paths(graph))
+
+
+def part2(graph):
+    return len(find_paths(graph, allow_duplicate=True))
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""\
     start-A
     start-b
@@ -43,14 +69,18 @@ def main():
     assert len(find_paths(graph)) == 10
     assert len(find_paths(graph, allow_duplicate=True)) == 36
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
         graph = read_input(f.read())
 
     print("part 1")
-    print(len(find_paths(graph)))
+    print(part1(graph))
 
     print("part 2")
-    print(len(find_paths(graph, allow_duplicate=True)))
+    print(part2(graph))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,4 @@
 #!/usr/bin/env python
-from textwrap import dedent
 
 
 def read_input(s):
@@ -44,7 +43,25 @@ def format_sheet(points):
     return "\n".join(lines)
 
 
-def main():
+def part1(data):
+    points, folds = data
+    return len(apply_fold(points, folds[0]))
+
+
+def part2(data):
+    points, folds = data
+    for fold in folds:
+        points = apply_fold(points, fold)
+    return format_sheet(points)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""\
         6,10
         0,14
@@ -80,16 +97,18 @@ def main():
     #####
     """).strip()
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
-        points, folds = read_input(f.read())
+        data = read_input(f.read())
 
     print("part 1")
-    print(len(apply_fold(points, folds[0])))
+    print(part1(data))
 
     print("part 2")
-    for fold in folds:
-        points = apply_fold(points, fold)
-    print(format_sheet(points))
+    print(part2(data))
 
 
 if __name__ == "__main__":
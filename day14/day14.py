@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 from collections import Counter, defaultdict
-from textwrap import dedent
 
 
 def read_input(s):
@@ -45,7 +44,23 @@ def get_answer(template, polymer):
     return freq[0][1] - freq[-1][1]
 
 
-def main():
+def part1(data):
+    template, rules = data
+    return get_answer(template, grow(template, rules, 10))
+
+
+def part2(data):
+    template, rules = data
+    return get_answer(template, grow(template, rules, 40))
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""\
     NNCB
 
@@ -70,16 +85,18 @@ def main():
     polymer = grow(template, rules, 10)
     assert get_answer(template, polymer) == 1588
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
-        template, rules = read_input(f.read())
+        data = read_input(f.read())
 
     print("part 1")
-    polymer = grow(template, rules, 10)
-    print(get_answer(template, polymer))
+    print(part1(data))
 
     print("part 2")
-    polymer = grow(template, rules, 40)
-    print(get_answer(template, polymer))
+    print(part2(data))
 
 
 if __name__ == "__main__":
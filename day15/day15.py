@@ -1,42 +1,57 @@
 #!/usr/bin/env python
 import heapq
-from textwrap import dedent
+import os
+import sys
+from array import array
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from aoc import instrument
+from aoc.grid import Grid
+
+heap_pushes = instrument.counter("day15.heap_push")
+heap_pops = instrument.counter("day15.heap_pop")
 
 
 class Graph:
     def __init__(self, map_, scale=1):
         self.map = map_
-        self.width = (max(x for x, _ in map_) + 1)
-        self.height = (max(y for _, y in map_) + 1)
+        self.width = map_.width
+        self.height = map_.height
         self.scale = scale
+        # The full, tiled map is built once, so looking up a level is a
+        # single array access
+        self.grid = Grid(self.width * scale, self.height * scale)
+        for y in range(self.height * scale):
+            qy, ry = divmod(y, self.height)
+            row = map_.row(ry)
+            start = self.grid.index(0, y)
+            for qx in range(scale):
+                tile = array("b", [((level - 1 + qx + qy) % 9) + 1 for level in row])
+                self.grid.cells[start + qx*self.width:start + (qx+1)*self.width] = tile
 
     @property
     def source(self):
-        return (0, 0)
+        return self.grid.index(0, 0)
 
     @property
     def target(self):
-        return (self.width*self.scale - 1, self.height*self.scale - 1)
+        return self.grid.index(self.width*self.scale - 1, self.height*self.scale - 1)
 
     def get_level(self, node):
-        x, y = node
-        qx, rx = divmod(x, self.width)
-        qy, ry = divmod(y, self.height)
-        return ((self.map[(rx, ry)] - 1 + qx + qy) % 9) + 1
+        return self.grid.cells[node]
 
     def get_neighbours(self, node):
-        x, y = node
-        for dx, dy in ((-1, 0), (0, 1), (1, 0), (0, -1)):
-            nx = x + dx
-            ny = y + dy
-            if 0 <= nx < self.width*self.scale and 0 <= ny < self.height*self.scale:
-                neighbour = (nx, ny)
-                yield neighbour, self.get_level(neighbour)
+        cells = self.grid.cells
+        for neighbour in self.grid.neighbours4(node):
+            yield neighbour, cells[neighbour]
 
     def print_path(self, path):
+        path = set(path)
         for y in range(self.height*self.scale):
             for x in range(self.width*self.scale):
-                node = (x, y)
+                node = self.grid.index(x, y)
                 level = self.get_level(node)
                 if node == self.source or node in path:
                     print(f"\033[1m{level}\033[0m", end="")
@@ -47,33 +62,41 @@ class Graph:
 
 
 def read_input(s):
-    m = {}
-    for y, line in enumerate(s.splitlines()):
-        for x, value in enumerate(line):
-            m[(x, y)] = int(value)
-    return m
+    return Grid.from_digits(s)
 
 
+@instrument.timed("day15.find_shortest_path")
 def find_shortest_path(graph):
     source, target = graph.source, graph.target
+    cells, border, offsets = graph.grid.cells, graph.grid.border, graph.grid.offsets4
+    unreached = 2**31 - 1
+    dist = array("i", [unreached]) * len(cells)
+    prev = array("i", [-1]) * len(cells)
+    dist[source] = 0
     queue = [(0, source)]
-    dist = {source: 0}
-    prev = {}
     while queue:
         cur_dist, node = heapq.heappop(queue)
+        heap_pops()
         if node == target:
             path = []
-            while node:
-                path = [node] + path
+            while node != source:
+                path.append(node)
                 node = prev[node]
-                if node == source:
-                    return path
-        for neighbour, weight in graph.get_neighbours(node):
+            path.reverse()
+            return path
+        if cur_dist > dist[node]:
+            continue
+        for o in offsets:
+            neighbour = node + o
+            weight = cells[neighbour]
+            if weight == border:
+                continue
             alt = cur_dist + weight
-            if neighbour not in dist or alt < dist[neighbour]:
+            if alt < dist[neighbour]:
                 dist[neighbour] = alt
                 prev[neighbour] = node
                 heapq.heappush(queue, (alt, neighbour))
+                heap_pushes()
 
     raise RuntimeError("Path not found")
 
@@ -85,7 +108,21 @@ def lowest_total_risk(graph, echo=True):
     return sum(graph.get_level(node) for node in path)
 
 
-def main():
+def part1(m):
+    return lowest_total_risk(Graph(m), echo=False)
+
+
+def part2(m):
+    return lowest_total_risk(Graph(m, scale=5), echo=False)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""\
     1163751742
     1381373672
@@ -102,14 +139,18 @@ def main():
     assert lowest_total_risk(Graph(m)) == 40
     assert lowest_total_risk(Graph(m, scale=5)) == 315
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
         m = read_input(f.read())
 
     print("part 1")
-    print(lowest_total_risk(Graph(m), echo=False))
+    print(part1(m))
 
     print("part 2")
-    print(lowest_total_risk(Graph(m, scale=5), echo=False))
+    print(part2(m))
 
 
 if __name__ == "__main__":
@@ -1,21 +1,31 @@
 #!/usr/bin/env python
 import math
+import os
+import sys
 from collections import namedtuple
-from enum import Enum, IntEnum
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from aoc import instrument
 
 Packet = namedtuple("Packet", "version type_id value subpackets")
 
+packets_parsed = instrument.counter("day16.parse_packet")
+packets_evaluated = instrument.counter("day16.evaluate")
+
+@instrument.timed("day16.hex2bin")
 def hex2bin(s):
     return "".join("{:04b}".format(int(c, 16)) for c in s)
 
 
-class State(Enum):
+class State:
     Header = "header"
     Literal = "literal"
     Operator = "operator"
 
 
-class Type(IntEnum):
+class Type:
     Sum = 0
     Product = 1
     Minimum = 2
@@ -44,6 +54,7 @@ class Stream:
 
 
 def parse_packet(stream, outer=True):
+    packets_parsed()
     version, type_id, value = None, None, None
     subpackets, subpackets_len, subpackets_num = None, None, None
     state = State.Header
@@ -90,6 +101,10 @@ def parse_packet(stream, outer=True):
     raise RuntimeError("Failed to parse packet")
 
 
+def read_input(s):
+    return parse_packet(Stream(s.strip()))
+
+
 def iter_version_numbers(packet):
     yield packet.version
     for subpacket in packet.subpackets or []:
@@ -97,6 +112,7 @@ def iter_version_numbers(packet):
 
 
 def evaluate(packet):
+    packets_evaluated()
     if packet.type_id == Type.Sum:
         return sum(evaluate(p) for p in packet.subpackets)
     elif packet.type_id == Type.Product:
@@ -120,7 +136,19 @@ def evaluate(packet):
     raise RuntimeError(f"Invalid packet type: {packet.type_id}")
 
 
-def main():
+def part1(packet):
+    return sum(iter_version_numbers(packet))
+
+
+def part2(packet):
+    return evaluate(packet)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
     assert hex2bin("D2FE28") == "110100101111111000101000"
     assert parse_packet(Stream("D2FE28")) == Packet(
         version=6,
@@ -154,15 +182,18 @@ def main():
 
     assert evaluate(parse_packet(Stream("C200B40A82"))) == 3
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
-        transmission = f.read().strip()
-        packet = parse_packet(Stream(transmission))
+        packet = read_input(f.read())
 
     print("part 1")
-    print(sum(iter_version_numbers(packet)))
+    print(part1(packet))
 
     print("part 2")
-    print(evaluate(packet))
+    print(part2(packet))
 
 
 if __name__ == "__main__":
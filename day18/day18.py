@@ -1,14 +1,26 @@
 #!/usr/bin/env python
 import math
+import os
 import re
+import sys
 from functools import reduce
 from itertools import permutations
 
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from aoc import instrument
+
+
+def read_input(s):
+    return s.split()
+
 
 def iter_tokens(s):
     return filter(None, re.split(r"([\[\],])", s))
 
 
+@instrument.timed("day18.explode")
 def explode(s):
     depth = 0
     result = []
@@ -46,6 +58,7 @@ def explode(s):
     return "".join(result)
 
 
+@instrument.timed("day18.split")
 def split(s):
     result = []
     token_iter = iter_tokens(s)
@@ -62,6 +75,7 @@ def split(s):
     return "".join(result)
 
 
+@instrument.timed("day18.add")
 def add(a, b):
     result = "".join(["[", a, ",", b, "]"])
     while True:
@@ -95,7 +109,19 @@ def magnitude(s):
     return stack[0]
 
 
-def main():
+def part1(numbers):
+    return magnitude(reduce(add, numbers))
+
+
+def part2(numbers):
+    return max(magnitude(add(a, b)) for a, b in permutations(numbers, 2))
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
     assert explode("[[[[[9,8],1],2],3],4]") == "[[[[0,9],2],3],4]"
     assert explode("[7,[6,[5,[4,[3,2]]]]]") == "[7,[6,[5,[7,0]]]]"
     assert explode("[[6,[5,[4,[3,2]]]],1]") == "[[6,[5,[7,0]]],3]"
@@ -165,16 +191,18 @@ def main():
 
     assert magnitude("[[[[6,6],[7,6]],[[7,7],[7,0]]],[[[7,7],[7,7]],[[7,8],[9,9]]]]") == 4140
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
-        numbers = f.read().split()
+        numbers = read_input(f.read())
 
     print("part 1")
-    result = reduce(add, numbers)
-    print(magnitude(result))
+    print(part1(numbers))
 
     print("part 2")
-    max_magnitude = max(magnitude(add(a, b)) for a, b in permutations(numbers, 2))
-    print(max_magnitude)
+    print(part2(numbers))
 
 
 if __name__ == "__main__":
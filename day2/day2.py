@@ -1,7 +1,19 @@
 #!/usr/bin/env python
+import os
+import sys
+from array import array
+from functools import reduce
+from importlib.util import find_spec
+
+CHUNK_BYTES = 64 * 2**20
+FORWARD, DOWN, UP = b"fdu"
+
 
 def read_course(s):
-    return [(d, int(n)) for d, n in [l.split() for l in s.strip().splitlines()]]
+    return [(d, int(n)) for d, n in (l.split() for l in s.splitlines() if l.strip())]
+
+
+read_input = read_course
 
 
 def follow(course):
@@ -29,7 +41,149 @@ def follow_with_aim(course):
     return pos, depth
 
 
-def main():
+# A course (or any part of it) acts on (pos, depth, aim) as an affine map,
+# which is fully described by (forward, aim, depth): the total distance
+# moved forward, the change in aim and the depth gained when starting with
+# aim 0. Starting with aim a0 instead adds a0 * forward to the depth. Without
+# aim, the depth is simply the change in aim.
+
+def reduce_course(course):
+    forward, aim, depth = 0, 0, 0
+    for d, n in course:
+        if d == 'forward':
+            forward += n
+            depth += aim * n
+        elif d == 'down':
+            aim += n
+        elif d == 'up':
+            aim -= n
+    return forward, aim, depth
+
+
+def combine(left, right):
+    f1, a1, d1 = left
+    f2, a2, d2 = right
+    return f1 + f2, a1 + a2, d1 + d2 + a1 * f2
+
+
+def reduce_chunk(path, start, end):
+    # Works on the raw bytes: only the first letter of a command is needed
+    forward, aim, depth = 0, 0, 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    for line in data.split(b"\n"):
+        d, _, n = line.partition(b" ")
+        if not n:
+            continue
+        n = int(n)
+        if d[0] == FORWARD:
+            forward += n
+            depth += aim * n
+        elif d[0] == DOWN:
+            aim += n
+        elif d[0] == UP:
+            aim -= n
+    return forward, aim, depth
+
+
+def chunk_bounds(path, chunk_bytes=CHUNK_BYTES):
+    # Byte ranges of roughly chunk_bytes, each ending after a newline
+    size = os.path.getsize(path)
+    bounds = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def follow_file(path, workers=None, chunk_bytes=CHUNK_BYTES):
+    bounds = chunk_bounds(path, chunk_bytes)
+    if not bounds:
+        return 0, 0, 0
+    paths = [path] * len(bounds)
+    starts, ends = zip(*bounds)
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return reduce(combine, pool.map(reduce_chunk, paths, starts, ends))
+
+
+# Compact form: one direction byte (the command's first letter) and one
+# int32 amount per command, about 5 bytes instead of a tuple per command
+
+def encode_course(s):
+    if isinstance(s, str):
+        s = s.encode()
+    words = s.split()
+    return bytes(w[0] for w in words[0::2]), array("i", map(int, words[1::2]))
+
+
+def follow_encoded(codes, amounts):
+    pos, depth = 0, 0
+    for d, n in zip(codes, amounts):
+        if d == FORWARD:
+            pos += n
+        elif d == DOWN:
+            depth += n
+        elif d == UP:
+            depth -= n
+    return pos, depth
+
+
+def follow_with_aim_encoded(codes, amounts):
+    pos, depth, aim = 0, 0, 0
+    for d, n in zip(codes, amounts):
+        if d == FORWARD:
+            pos += n
+            depth += aim * n
+        elif d == DOWN:
+            aim += n
+        elif d == UP:
+            aim -= n
+    return pos, depth
+
+
+def follow_with_aim_array(codes, amounts, chunk=2**20):
+    # aim is the running sum of the signed up/down amounts. Work in chunks
+    # so the int64 products stay small and Python ints carry the totals.
+    import numpy as np
+
+    codes = np.frombuffer(codes, dtype=np.uint8)
+    amounts = np.frombuffer(amounts, dtype=np.int32)
+    pos, depth, aim = 0, 0, 0
+    for i in range(0, len(codes), chunk):
+        d = codes[i:i+chunk]
+        n = amounts[i:i+chunk].astype(np.int64)
+        steps = np.where(d == DOWN, n, 0) - np.where(d == UP, n, 0)
+        forward = np.where(d == FORWARD, n, 0)
+        aims = np.cumsum(steps) + aim
+        pos += int(forward.sum())
+        depth += int((aims * forward).sum())
+        aim = int(aims[-1])
+    return pos, depth
+
+
+def part1(course):
+    pos, depth = follow(course)
+    return pos * depth
+
+
+def part2(course):
+    pos, depth = follow_with_aim(course)
+    return pos * depth
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
     example = """
     forward 5
     down 5
@@ -46,16 +200,37 @@ def main():
     pos, depth = follow_with_aim(course)
     assert (pos, depth) == (15, 60)
 
+    assert reduce_course(course) == (15, 10, 60)
+    assert combine(reduce_course(course[:3]), reduce_course(course[3:])) == (15, 10, 60)
+
+    codes, amounts = encode_course(example)
+    assert follow_encoded(codes, amounts) == (15, 10)
+    assert follow_with_aim_encoded(codes, amounts) == (15, 60)
+    if find_spec("numpy"):
+        assert follow_with_aim_array(codes, amounts) == (15, 60)
+        assert follow_with_aim_array(codes, amounts, chunk=2) == (15, 60)
+
+
+def main():
+    # With arguments, follow a (large) course log in parallel chunks,
+    # e.g. day2.py course.log 8
+    if len(sys.argv) > 1:
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        forward, aim, depth = follow_file(sys.argv[1], workers)
+        print(forward * aim)
+        print(forward * depth)
+        return
+
+    check()
+
     with open("input.txt") as f:
         course = read_course(f.read())
 
     print("part 1")
-    pos, depth = follow(course)
-    print(pos * depth)
+    print(part1(course))
 
     print("part 2")
-    pos, depth = follow_with_aim(course)
-    print(pos * depth)
+    print(part2(course))
 
 
 if __name__ == "__main__":
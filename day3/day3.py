@@ -1,9 +1,14 @@
 #!/usr/bin/env python
+import sys
+from bisect import bisect_left
 from collections import defaultdict
-from textwrap import dedent
+from importlib.util import find_spec
 
 def read_report(s):
-    return s.strip().splitlines()
+    return [l.strip() for l in s.splitlines() if l.strip()]
+
+
+read_input = read_report
 
 
 def get_bit_counts(report):
@@ -25,31 +30,85 @@ def get_diagnostics(report):
     return int(gamma, 2), int(epsilon, 2)
 
 
-def get_life_support_rating(report):
-    candidates = report[:]
-    for i in range(len(report[0])):
-        counts = get_bit_counts(candidates)
-        freq = sorted(counts[i].items(), key=lambda item: (item[1], item[0]), reverse=True)
-        most_common = freq[0][0]
-        candidates = [c for c in candidates if c[i] == most_common]
-        if len(candidates) == 1:
-            break
-    oxygen = candidates[0]
-
-    candidates = report[:]
-    for i in range(len(report[0])):
-        counts = get_bit_counts(candidates)
-        freq = sorted(counts[i].items(), key=lambda item: (item[1], item[0]), reverse=True)
-        least_common = freq[1][0]
-        candidates = [c for c in candidates if c[i] == least_common]
-        if len(candidates) == 1:
+def diagnostics_from_counts(n, ones):
+    gamma = 0
+    for count in ones:
+        gamma = gamma << 1 | (2 * count > n)
+    return gamma, gamma ^ ((1 << len(ones)) - 1)
+
+
+def count_bits_array(data, width, bits):
+    # Lines of equal width laid out as rows of a uint8 matrix; the columns
+    # past the bits digits hold the line ending
+    import numpy as np
+
+    rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, width)
+    return len(rows), (rows[:, :bits] == 49).sum(axis=0)
+
+
+def count_file_bits(path, chunk_rows=2**20):
+    # Streams the report in blocks of whole lines, so only one block of
+    # chunk_rows lines is in memory at a time
+    with open(path, "rb") as f:
+        line = f.readline()
+        bits = len(line.rstrip(b"\r\n"))
+        width, ending = len(line), line[bits:]
+        n, ones = 0, [0] * bits
+        f.seek(0)
+        while block := f.read(width * chunk_rows):
+            if not block.endswith(ending):
+                block += ending
+            rows, counts = count_bits_array(block, width, bits)
+            n, ones = n + rows, [a + int(b) for a, b in zip(ones, counts)]
+    return n, ones
+
+
+def pack_report(report):
+    # Sorted ints: the numbers sharing a prefix form a contiguous range,
+    # split in two by the first one with the next bit set
+    return len(report[0]), sorted(int(number, 2) for number in report)
+
+
+def find_rating(bits, values, most_common):
+    lo, hi, prefix = 0, len(values), 0
+    for i in reversed(range(bits)):
+        if hi - lo == 1:
             break
-    co2 = candidates[0]
+        mid = bisect_left(values, prefix | 1 << i, lo, hi)
+        zeros, ones = mid - lo, hi - mid
+        if most_common:
+            keep_ones = ones >= zeros
+        else:
+            keep_ones = ones < zeros
+        if keep_ones and ones or not zeros:
+            lo, prefix = mid, prefix | 1 << i
+        else:
+            hi = mid
+    return values[lo]
+
 
-    return int(oxygen, 2), int(co2, 2)
+def get_life_support_rating(report):
+    bits, values = pack_report(report)
+    return find_rating(bits, values, True), find_rating(bits, values, False)
 
 
-def main():
+def part1(report):
+    gamma, epsilon = get_diagnostics(report)
+    return gamma * epsilon
+
+
+def part2(report):
+    oxygen, co2 = get_life_support_rating(report)
+    return oxygen * co2
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""
     00100
     11110
@@ -72,16 +131,31 @@ def main():
     oxygen, co2 = get_life_support_rating(report)
     assert (oxygen, co2) == (23, 10)
 
+    assert diagnostics_from_counts(12, [7, 5, 8, 7, 5]) == (22, 9)
+    if find_spec("numpy"):
+        data = "\n".join(report).encode() + b"\n"
+        n, ones = count_bits_array(data, 6, 5)
+        assert diagnostics_from_counts(n, list(ones)) == (22, 9)
+
+
+def main():
+    # With an argument, compute the power consumption of a large report in
+    # streaming chunks, e.g. day3.py report.txt
+    if len(sys.argv) > 1:
+        gamma, epsilon = diagnostics_from_counts(*count_file_bits(sys.argv[1]))
+        print(gamma * epsilon)
+        return
+
+    check()
+
     with open("input.txt") as f:
         report = read_report(f.read())
 
-    gamma, epsilon = get_diagnostics(report)
     print("part 1")
-    print(gamma * epsilon)
+    print(part1(report))
 
-    oxygen, co2 = get_life_support_rating(report)
     print("part 2")
-    print(oxygen * co2)
+    print(part2(report))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
 #!/usr/bin/env python
-from textwrap import dedent
+from array import array
+from collections import defaultdict
+from functools import partial
+from importlib.util import find_spec
+from itertools import chain
 
 
 class Board:
@@ -80,7 +84,100 @@ def get_last_winning_board(numbers, boards):
     raise RuntimeError("no winning board")
 
 
-def main():
+class Bingo:
+    # Cells are numbered board * size + row * width + col. Each number maps
+    # to the cells holding it, so a draw only touches the boards that have
+    # it, and counting the hits per row and column detects wins directly.
+    def __init__(self, boards):
+        self.height, self.width = len(boards[0].rows), len(boards[0].rows[0])
+        self.size = self.height * self.width
+        self.index = defaultdict(partial(array, "i"))
+        cells = chain.from_iterable(chain.from_iterable(board.rows for board in boards))
+        for cell, n in enumerate(cells):
+            self.index[n].append(cell)
+        self.unmarked = [sum(map(sum, board.rows)) for board in boards]
+        self.row_hits = bytearray(len(boards) * self.height)
+        self.col_hits = bytearray(len(boards) * self.width)
+        self.won = bytearray(len(boards))
+
+    def draw(self, n):
+        # Returns (board, score) for each board that wins with this number
+        full = []
+        for cell in self.index.pop(n, ()):
+            b, rc = divmod(cell, self.size)
+            if self.won[b]:
+                continue
+            r, c = divmod(rc, self.width)
+            self.unmarked[b] -= n
+            row, col = b * self.height + r, b * self.width + c
+            self.row_hits[row] += 1
+            self.col_hits[col] += 1
+            if self.row_hits[row] == self.width or self.col_hits[col] == self.height:
+                full.append(b)
+        winners = []
+        for b in full:
+            if not self.won[b]:
+                self.won[b] = 1
+                winners.append((b, n * self.unmarked[b]))
+        return winners
+
+    def play(self, numbers):
+        # Yields (board, score) in the order the boards win
+        for n in numbers:
+            yield from self.draw(n)
+
+
+def winning_turns(numbers, boards):
+    # A board wins on the turn its first line is complete, and a line is
+    # complete once its last number is drawn: min over lines of max rank.
+    # Boards that never win get len(numbers) and a score of 0.
+    import numpy as np
+
+    numbers = np.array(numbers)
+    grid = np.array([board.rows for board in boards])
+    rank = np.full(max(numbers.max(), grid.max()) + 1, len(numbers))
+    rank[numbers[::-1]] = np.arange(len(numbers))[::-1]
+    ranks = rank[grid]
+    turns = np.minimum(ranks.max(axis=2).min(axis=1), ranks.max(axis=1).min(axis=1))
+    won = turns < len(numbers)
+    unmarked = np.where(ranks > turns[:, None, None], grid, 0).sum(axis=(1, 2))
+    scores = np.where(won, unmarked * numbers[np.where(won, turns, 0)], 0)
+    return turns, scores
+
+
+def rank_winners(numbers, boards):
+    # (board, score) in winning order, as Bingo.play() yields them, so the
+    # first, last or k-th winner is a lookup
+    import numpy as np
+
+    turns, scores = winning_turns(numbers, boards)
+    order = np.argsort(turns, kind="stable")
+    order = order[turns[order] < len(numbers)]
+    return list(zip(order.tolist(), scores[order].tolist()))
+
+
+def part1(data):
+    numbers, boards = data
+    for _, score in Bingo(boards).play(numbers):
+        return score
+    raise RuntimeError("no winning board")
+
+
+def part2(data):
+    numbers, boards = data
+    winners = list(Bingo(boards).play(numbers))
+    if len(winners) < len(boards):
+        raise RuntimeError("no winning board")
+    return winners[-1][1]
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""
     7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
 
@@ -110,16 +207,25 @@ def main():
     board = get_last_winning_board(numbers, boards)
     assert board.score == 1924
 
+    numbers, boards = read_input(example)
+    assert list(Bingo(boards).play(numbers)) == [(2, 4512), (0, 2192), (1, 1924)]
+    assert (part1((numbers, boards)), part2((numbers, boards))) == (4512, 1924)
+    if find_spec("numpy"):
+        assert rank_winners(numbers, boards) == [(2, 4512), (0, 2192), (1, 1924)]
+        assert rank_winners(numbers[:5], boards) == []
+
+
+def main():
+    check()
+
     with open("input.txt") as f:
-        numbers, boards = read_input(f.read())
+        data = read_input(f.read())
 
-    board = get_first_winning_board(numbers, boards)
     print("part 1")
-    print(board.score)
+    print(part1(data))
 
-    board = get_last_winning_board(numbers, boards)
     print("part 2")
-    print(board.score)
+    print(part2(data))
 
 
 if __name__ == "__main__":
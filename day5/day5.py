@@ -1,6 +1,7 @@
 #!/usr/bin/env python
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
-from textwrap import dedent
+from importlib.util import find_spec
 
 
 def read_input(s):
@@ -34,7 +35,170 @@ def count_covered_points(lines, diagonals=False):
     return sum([1 for v in points.values() if v > 1])
 
 
-def main():
+def count_covered_points_array(lines, diagonals=False, batch=4096):
+    # Rasterizes into a flat counter grid: a segment's points are its start
+    # index plus multiples of a stride (1 along x, width along y). Each
+    # batch of segments becomes one array of indices added with bincount.
+    import numpy as np
+
+    segments = np.array(lines, dtype=np.int64).reshape(-1, 4)
+    x1, y1, x2, y2 = segments.T
+    dx, dy = x2 - x1, y2 - y1
+    keep = (dx == 0) | (dy == 0)
+    if diagonals:
+        keep |= np.abs(dx) == np.abs(dy)
+    segments = segments[keep]
+    if not len(segments):
+        return 0
+
+    width = int(segments[:, 0::2].max()) + 1
+    height = int(segments[:, 1::2].max()) + 1
+    counts = np.zeros(width * height, dtype=np.int32)
+    for i in range(0, len(segments), batch):
+        x1, y1, x2, y2 = segments[i:i+batch].T
+        dx, dy = x2 - x1, y2 - y1
+        lengths = np.maximum(np.abs(dx), np.abs(dy)) + 1
+        starts = np.repeat(y1 * width + x1, lengths)
+        strides = np.repeat(np.sign(dy) * width + np.sign(dx), lengths)
+        steps = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        counts += np.bincount(starts + steps * strides, minlength=len(counts)).astype(np.int32)
+
+    return int(np.count_nonzero(counts > 1))
+
+
+# Every segment lies on a line a*x + b*y = key of one of four families. The
+# position along the line is x, except for vertical lines where it is y.
+FAMILIES = {"V": (1, 0), "H": (0, 1), "D": (1, -1), "A": (1, 1)}
+
+
+def classify(line):
+    (x1, y1), (x2, y2) = line
+    if x1 == x2:
+        return "V", x1, min(y1, y2), max(y1, y2)
+    if y1 == y2:
+        return "H", y1, min(x1, x2), max(x1, x2)
+    if x2 - x1 == y2 - y1:
+        return "D", x1 - y1, min(x1, x2), max(x1, x2)
+    if x2 - x1 == y1 - y2:
+        return "A", x1 + y1, min(x1, x2), max(x1, x2)
+    return None
+
+
+def to_point(family, key, t):
+    a, b = FAMILIES[family]
+    return (key, t) if family == "V" else (t, (key - a * t) // b)
+
+
+def coverage_runs(intervals):
+    # Sweeps the interval ends of one line and returns the runs covered at
+    # least once and at least twice. Touching runs are merged.
+    changes = defaultdict(int)
+    for t1, t2 in intervals:
+        changes[t1] += 1
+        changes[t2 + 1] -= 1
+    covered, overlaps = [], []
+    depth = 0
+    for t in sorted(changes):
+        before, depth = depth, depth + changes[t]
+        for runs, level in ((covered, 1), (overlaps, 2)):
+            if before < level <= depth:
+                runs.append([t, None])
+            elif depth < level <= before:
+                runs[-1][1] = t - 1
+    return covered, overlaps
+
+
+def crossings(f, runs_f, g, runs_g):
+    # Lattice points covered by family f and family g. In coordinates
+    # u = key of g and v = key of f, f runs are horizontal and g runs are
+    # vertical, so this is an orthogonal segment intersection sweep.
+    af, bf = FAMILIES[f]
+    ag, bg = FAMILIES[g]
+    det = af * bg - bf * ag
+    events = []
+    for v, runs in runs_f.items():
+        for t1, t2 in runs:
+            u1, u2 = sorted(ag * x + bg * y for x, y in (to_point(f, v, t1), to_point(f, v, t2)))
+            events.append((u1, 0, v))
+            events.append((u2, 2, v))
+    for u, runs in runs_g.items():
+        for t1, t2 in runs:
+            v1, v2 = sorted(af * x + bf * y for x, y in (to_point(g, u, t1), to_point(g, u, t2)))
+            events.append((u, 1, v1, v2))
+    events.sort()
+
+    active = []
+    for event in events:
+        if event[1] == 0:
+            insort(active, event[2])
+        elif event[1] == 2:
+            del active[bisect_left(active, event[2])]
+        else:
+            u, _, v1, v2 = event
+            for v in active[bisect_left(active, v1):bisect_right(active, v2)]:
+                x, rx = divmod(v * bg - bf * u, det)
+                y, ry = divmod(af * u - v * ag, det)
+                if not rx and not ry:
+                    yield x, y
+
+
+def count_overlaps_sweep(lines, diagonals=False):
+    # Points on two segments of the same line come from interval runs,
+    # points on lines of two different families from crossings. Memory
+    # grows with the number of segments and crossings, not the area.
+    families = "VHDA" if diagonals else "VH"
+    intervals = {f: defaultdict(list) for f in families}
+    for line in lines:
+        segment = classify(line)
+        if segment and segment[0] in intervals:
+            family, key, t1, t2 = segment
+            intervals[family][key].append((t1, t2))
+
+    covered, overlaps = {}, {}
+    total = 0
+    for f in families:
+        covered[f], overlaps[f] = {}, {}
+        for key, spans in intervals[f].items():
+            covered[f][key], runs = coverage_runs(spans)
+            if runs:
+                overlaps[f][key] = ([t1 for t1, _ in runs], [t2 for _, t2 in runs])
+                total += sum(t2 - t1 + 1 for t1, t2 in runs)
+
+    def count_overlaps(x, y):
+        count = 0
+        for f in families:
+            a, b = FAMILIES[f]
+            if a * x + b * y in overlaps[f]:
+                starts, ends = overlaps[f][a * x + b * y]
+                t = y if f == "V" else x
+                i = bisect_right(starts, t) - 1
+                count += i >= 0 and t <= ends[i]
+        return count
+
+    # A crossing point is counted once, minus the times the runs of each
+    # family have already counted it
+    points = set()
+    for i, f in enumerate(families):
+        for g in families[i+1:]:
+            points.update(crossings(f, covered[f], g, covered[g]))
+    return total + sum(1 - count_overlaps(x, y) for x, y in points)
+
+
+def part1(lines):
+    return count_covered_points(lines)
+
+
+def part2(lines):
+    return count_covered_points(lines, diagonals=True)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""
     0,9 -> 5,9
     8,0 -> 0,8
@@ -50,17 +214,27 @@ def main():
     lines = read_input(example)
     assert count_covered_points(lines) == 5
     assert count_covered_points(lines, diagonals=True) == 12
+    if find_spec("numpy"):
+        assert count_covered_points_array(lines) == 5
+        assert count_covered_points_array(lines, diagonals=True) == 12
+        assert count_covered_points_array(lines, diagonals=True, batch=3) == 12
+
+    assert count_overlaps_sweep(lines) == 5
+    assert count_overlaps_sweep(lines, diagonals=True) == 12
+    assert coverage_runs([(0, 4), (2, 6), (7, 8), (3, 3)]) == ([[0, 8]], [[2, 4]])
+
+
+def main():
+    check()
 
     with open("input.txt") as f:
         lines = read_input(f.read())
 
-    count = count_covered_points(lines)
     print("part 1")
-    print(count)
+    print(part1(lines))
 
-    count = count_covered_points(lines, diagonals=True)
     print("part 2")
-    print(count)
+    print(part2(lines))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,9 @@
 #!/usr/bin/env python
+from functools import lru_cache
+from importlib.util import find_spec
+
+TIMERS = 9
+
 
 def read_input(s):
     return list(map(int, s.split(",")))
@@ -24,21 +29,134 @@ def simulate_population(pop, days):
     return sum(state)
 
 
-def main():
+# step() is linear in the state, so TRANSITION[i][j] is the number of fish
+# with timer i one day after a single fish with timer j
+
+def mat_mul(a, b, mod=None):
+    result = tuple(tuple(sum(x * y for x, y in zip(row, col)) for col in zip(*b)) for row in a)
+    if mod:
+        result = tuple(tuple(x % mod for x in row) for row in result)
+    return result
+
+
+TRANSITION = tuple(zip(*(step([int(i == j) for i in range(10)])[:TIMERS] for j in range(TIMERS))))
+
+
+@lru_cache(maxsize=None)
+def transition_power(k, mod=None):
+    # TRANSITION ** (2 ** k), built from the previous square so that every
+    # query reuses the squares computed so far
+    if k == 0:
+        return TRANSITION
+    m = transition_power(k - 1, mod)
+    return mat_mul(m, m, mod)
+
+
+def population_after(pop, days, mod=None):
+    # Applies one cached square per set bit of days to the state vector
+    state = [pop.count(n) for n in range(TIMERS)]
+    k = 0
+    while days:
+        if days & 1:
+            m = transition_power(k, mod)
+            state = [sum(x * y for x, y in zip(row, state)) for row in m]
+            if mod:
+                state = [x % mod for x in state]
+        days >>= 1
+        k += 1
+    return sum(state) % mod if mod else sum(state)
+
+
+def descendant_table(max_days):
+    # table[d][t] is the number of fish after d days that descend from (and
+    # include) a single fish with timer t. A fish with timer t > 0 is a fish
+    # with timer t - 1 one day later; one with timer 0 becomes a 6 and an 8.
+    table = [(1,) * TIMERS]
+    for _ in range(max_days):
+        prev = table[-1]
+        table.append((prev[6] + prev[8],) + prev[:TIMERS-1])
+    return table
+
+
+def save_table(table, path):
+    import json
+
+    with open(path, "w") as f:
+        json.dump(table, f)
+
+
+def load_table(path):
+    import json
+
+    with open(path) as f:
+        return [tuple(row) for row in json.load(f)]
+
+
+def population_from_table(table, pop, days):
+    return sum(table[days][n] for n in pop)
+
+
+def batch_population(table, schools, days):
+    # The population is linear in the timer histogram, so stacking the
+    # histograms of all schools and the table rows of all horizons answers
+    # every (school, days) pair with one matrix product. Object arrays keep
+    # exact ints once the counts outgrow int64.
+    import numpy as np
+
+    counts = [[pop.count(n) for n in range(TIMERS)] for pop in schools]
+    rows = [table[d] for d in days]
+    largest = max(map(max, rows)) * max(map(len, schools))
+    dtype = np.int64 if largest < 2**63 else object
+    return np.array(counts, dtype=dtype) @ np.array(rows, dtype=dtype).T
+
+
+def part1(fish):
+    return simulate_population(fish, days=80)
+
+
+def part2(fish):
+    return simulate_population(fish, days=256)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
     example = "3,4,3,1,2"
     fish = read_input(example)
 
     assert simulate_population(fish, days=80) == 5934
     assert simulate_population(fish, days=256) == 26984457539
 
+    assert population_after(fish, 0) == 5
+    assert population_after(fish, 80) == 5934
+    assert population_after(fish, 256) == 26984457539
+    assert population_after(fish, 256, mod=10**9 + 7) == 26984457539 % (10**9 + 7)
+
+    table = descendant_table(256)
+    assert population_from_table(table, fish, 18) == 26
+    assert population_from_table(table, fish, 256) == 26984457539
+    if find_spec("numpy"):
+        result = batch_population(table, [fish, [3], fish * 2], [18, 80, 256])
+        assert result.tolist() == [
+            [26, 5934, 26984457539],
+            [5, 1154, 5217223242],
+            [52, 11868, 53968915078],
+        ]
+
+
+def main():
+    check()
+
     with open("input.txt") as f:
         fish = read_input(f.read())
 
     print("part 1")
-    print(simulate_population(fish, days=80))
+    print(part1(fish))
 
     print("part 2")
-    print(simulate_population(fish, days=256))
+    print(part2(fish))
 
 
 if __name__ == "__main__":
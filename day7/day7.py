@@ -4,11 +4,23 @@ def read_input(s):
     return list(map(int, s.split(",")))
 
 
+def fuel_part1(n):
+    return n
+
+
+def fuel_part2(n):
+    return n * (n + 1) // 2
+
+
+def cost(x, positions, fuel):
+    return sum(fuel(abs(pos - x)) for pos in positions)
+
+
 def cost_part1(x, positions):
-    return sum(abs(pos - x) for pos in positions)
+    return cost(x, positions, fuel_part1)
 
 def cost_part2(x, positions):
-    return sum((n := abs(pos - x), n*(n+1)//2)[1] for pos in positions)
+    return cost(x, positions, fuel_part2)
 
 
 def find_best_position_and_cost(positions):
@@ -50,23 +62,187 @@ def find_best_position_and_cost_part2(positions):
     return initial_pos, initial_cost
 
 
-def main():
+def triangular_cost(x, n, s1, s2, linear):
+    # sum d(d+1)/2 = (sum d^2 + sum d) / 2 with sum d^2 = S2 - 2x S1 + x^2 N,
+    # from the crab count N, sum S1 and sum of squares S2 and the linear cost
+    return (s2 - 2 * x * s1 + x * x * n + linear) // 2
+
+
+def histogram(positions):
+    lo = min(positions)
+    counts = [0] * (max(positions) - lo + 1)
+    for pos in positions:
+        counts[pos - lo] += 1
+    return lo, counts
+
+
+def position_costs(positions):
+    # Part 1 and part 2 costs of every position from min to max. Linear cost
+    # splits at x into crabs left and right of it, using running counts and
+    # sums of positions.
+    lo, counts = histogram(positions)
+    n, s1, s2 = len(positions), sum(positions), sum(pos * pos for pos in positions)
+    linear, triangular = [], []
+    left_count = left_sum = 0
+    for x, count in enumerate(counts, lo):
+        left_count += count
+        left_sum += count * x
+        d1 = x * left_count - left_sum + (s1 - left_sum) - x * (n - left_count)
+        linear.append(d1)
+        triangular.append(triangular_cost(x, n, s1, s2, d1))
+    return lo, linear, triangular
+
+
+def find_best_position_and_cost_convex(positions, fuel):
+    # For a convex, non-decreasing fuel(distance) the total cost is convex
+    # in x, so binary search for the first x where it stops decreasing.
+    # Each evaluation is over the distinct positions only.
+    lo, counts = histogram(positions)
+    hist = [(pos, count) for pos, count in enumerate(counts, lo) if count]
+
+    def total(x):
+        return sum(count * fuel(abs(pos - x)) for pos, count in hist)
+
+    left, right = lo, lo + len(counts) - 1
+    while left < right:
+        mid = (left + right) // 2
+        if total(mid + 1) < total(mid):
+            left = mid + 1
+        else:
+            right = mid
+    return left, total(left)
+
+
+class CrabSwarm:
+    # Crabs within [lo, hi] that can be added and removed. Two Fenwick trees
+    # over the positions hold the crab counts and position sums, so both
+    # costs at any x, and the median, take O(log range).
+    def __init__(self, lo, hi, positions=()):
+        self.lo, self.size = lo, hi - lo + 1
+        self.counts = [0] * (self.size + 1)
+        self.sums = [0] * (self.size + 1)
+        self.n = self.s1 = self.s2 = 0
+        for pos in positions:
+            self.add(pos)
+
+    def __len__(self):
+        return self.n
+
+    def _update(self, pos, k):
+        i = pos - self.lo + 1
+        if not 1 <= i <= self.size:
+            raise ValueError(f"position {pos} out of range")
+        while i <= self.size:
+            self.counts[i] += k
+            self.sums[i] += k * pos
+            i += i & -i
+        self.n += k
+        self.s1 += k * pos
+        self.s2 += k * pos * pos
+
+    def _prefix(self, x):
+        # Number and sum of the positions <= x
+        i = min(max(x - self.lo + 1, 0), self.size)
+        count = total = 0
+        while i:
+            count += self.counts[i]
+            total += self.sums[i]
+            i -= i & -i
+        return count, total
+
+    def add(self, pos):
+        self._update(pos, 1)
+
+    def remove(self, pos):
+        if self._prefix(pos)[0] == self._prefix(pos - 1)[0]:
+            raise ValueError(f"no crab at position {pos}")
+        self._update(pos, -1)
+
+    def kth(self, k):
+        # Smallest position with at least k crabs at or below it, found by
+        # descending the Fenwick tree one bit at a time
+        if not 1 <= k <= self.n:
+            raise ValueError("no such crab")
+        i = 0
+        for bit in reversed(range(self.size.bit_length())):
+            j = i + (1 << bit)
+            if j <= self.size and self.counts[j] < k:
+                i = j
+                k -= self.counts[j]
+        return self.lo + i
+
+    def cost_part1(self, x):
+        count, total = self._prefix(x)
+        return x * count - total + (self.s1 - total) - x * (self.n - count)
+
+    def cost_part2(self, x):
+        return triangular_cost(x, self.n, self.s1, self.s2, self.cost_part1(x))
+
+    def best_part1(self):
+        pos = self.kth((self.n + 1) // 2)
+        return pos, self.cost_part1(pos)
+
+    def best_part2(self):
+        # The optimum is within half a step of the mean
+        if not self.n:
+            raise ValueError("no crabs")
+        mean = self.s1 // self.n
+        candidates = range(max(mean - 1, self.lo), min(mean + 2, self.lo + self.size - 1) + 1)
+        cost, pos = min((self.cost_part2(x), x) for x in candidates)
+        return pos, cost
+
+
+def part1(positions):
+    _, cost = find_best_position_and_cost(positions)
+    return cost
+
+
+def part2(positions):
+    _, cost = find_best_position_and_cost_part2(positions)
+    return cost
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
     example = "16,1,2,0,4,2,7,1,2,14"
     positions = read_input(example)
 
     assert find_best_position_and_cost(positions) == (2, 37)
     assert find_best_position_and_cost_part2(positions) == (5, 168)
 
+    lo, linear, triangular = position_costs(positions)
+    assert lo == 0 and len(linear) == len(triangular) == 17
+    assert linear[2] == 37 and min(linear) == 37
+    assert triangular[5] == 168 and min(triangular) == 168
+    assert triangular[2] == 206
+    assert find_best_position_and_cost_convex(positions, fuel_part1) == (2, 37)
+    assert find_best_position_and_cost_convex(positions, fuel_part2) == (5, 168)
+
+    swarm = CrabSwarm(0, 20, positions)
+    assert swarm.best_part1() == (2, 37)
+    assert swarm.best_part2() == (5, 168)
+    assert all(swarm.cost_part2(x) == cost_part2(x, positions) for x in range(21))
+    swarm.remove(16)
+    swarm.add(20)
+    positions = positions[1:] + [20]
+    assert swarm.best_part1() == find_best_position_and_cost(positions)
+    assert swarm.best_part2()[1] == find_best_position_and_cost_part2(positions)[1]
+
+
+def main():
+    check()
+
     with open("input.txt") as f:
         positions = read_input(f.read())
 
-    _, cost = find_best_position_and_cost(positions)
     print("part 1")
-    print(cost)
+    print(part1(positions))
 
-    _, cost = find_best_position_and_cost_part2(positions)
     print("part 2")
-    print(cost)
+    print(part2(positions))
 
 
 if __name__ == "__main__":
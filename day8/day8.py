@@ -1,5 +1,6 @@
 #!/usr/bin/env python
-from functools import reduce
+from functools import lru_cache, reduce
+from itertools import permutations
 from operator import and_
 
 all_segments = {1, 2, 3, 4, 5, 6, 7}
@@ -55,7 +56,47 @@ def decode(outputs, mapping):
     return int("".join(digits))
 
 
-def main():
+# Patterns as 7-bit masks with wire a in bit 0. The sorted masks of the ten
+# input patterns do not depend on their order and identify the wiring, so
+# all 5040 wirings can be tabulated with the digit of each of their masks.
+
+def to_mask(pattern):
+    mask = 0
+    for c in pattern:
+        mask |= 1 << (ord(c) - 97)
+    return mask
+
+
+@lru_cache(maxsize=None)
+def signature_table():
+    table = {}
+    for wires in permutations(range(7)):
+        digits = {sum(1 << wires[x - 1] for x in segments): d for d, segments in digit_segments.items()}
+        table[tuple(sorted(digits))] = digits
+    return table
+
+
+def decode_entry(inputs, outputs):
+    digits = signature_table()[tuple(sorted(map(to_mask, inputs)))]
+    value = 0
+    for s in outputs:
+        value = value * 10 + digits[to_mask(s)]
+    return value
+
+
+def part1(entries):
+    return sum(1 for entry in entries for x in entry[1] if len(x) in (2, 3, 4, 7))
+
+
+def part2(entries):
+    return sum(decode_entry(inputs, outputs) for inputs, outputs in entries)
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
     example = "acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab | cdfeb fcadb cdfeb cdbaf"
     entries = read_input(example)
     inputs, outputs = entries[0]
@@ -64,14 +105,22 @@ def main():
     assert mapping == "deafgbc"
     assert decode(outputs, mapping) == 5353
 
+    assert len(signature_table()) == 5040
+    assert decode_entry(inputs, outputs) == 5353
+    assert decode_entry(inputs[::-1], ["ab", "dab", "eafb", "acedgfb"]) == 1748
+
+
+def main():
+    check()
+
     with open("input.txt") as f:
         entries = read_input(f.read())
 
     print("part 1")
-    print(sum(1 for entry in entries for x in entry[1] if len(x) in (2, 3, 4, 7)))
+    print(part1(entries))
 
     print("part 2")
-    print(sum(decode(outputs, find_mapping(inputs)) for inputs, outputs in entries))
+    print(part2(entries))
 
 
 if __name__ == "__main__":
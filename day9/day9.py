@@ -1,68 +1,81 @@
 #!/usr/bin/env python
-from textwrap import dedent
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from aoc.grid import Grid
 
 class Map:
-    def __init__(self, rows):
-        self.rows = rows
-        self.width = len(rows[0])
-        self.height = len(rows)
-
-    def is_low_point(self, x, y):
-        value = self.rows[y][x]
-        return all(value < n for _, _, n in self.iter_neighbours(x, y))
-
-    def iter_neighbours(self, x, y):
-        directions = ((0, -1), (1, 0), (0, 1), (-1, 0))
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if nx < 0 or nx >= self.width:
-                continue
-            if ny < 0 or ny >= self.height:
-                continue
-            yield nx, ny, self.rows[ny][nx]
+    def __init__(self, grid):
+        self.grid = grid
+        self.width = grid.width
+        self.height = grid.height
+
+    def is_low_point(self, i):
+        cells, border = self.grid.cells, self.grid.border
+        value = cells[i]
+        for o in self.grid.offsets4:
+            n = cells[i + o]
+            if n != border and n <= value:
+                return False
+        return True
 
     def iter_cells(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                yield x, y, self.rows[y][x], self.is_low_point(x, y)
-
-    def get_basin_size(self, x, y):
-        size = 0
-        visited = set()
-        queue = set([(x, y)])
-        while queue:
-            x, y = queue.pop()
-            visited.add((x, y))
-            size += 1
-            for nx, ny, value in self.iter_neighbours(x, y):
-                if (nx, ny) not in visited and value != 9:
-                    queue.add((nx, ny))
-        return size
+        cells = self.grid.cells
+        for i in self.grid.indices():
+            yield i, cells[i], self.is_low_point(i)
+
+    def get_basin_size(self, i):
+        cells, border, offsets = self.grid.cells, self.grid.border, self.grid.offsets4
+        visited = {i}
+        stack = [i]
+        while stack:
+            i = stack.pop()
+            for o in offsets:
+                n = i + o
+                if n not in visited and cells[n] != 9 and cells[n] != border:
+                    visited.add(n)
+                    stack.append(n)
+        return len(visited)
 
     def get_risk_score(self):
-        return sum(v + 1 for _, _, v, is_lo in self.iter_cells() if is_lo)
+        return sum(v + 1 for _, v, is_lo in self.iter_cells() if is_lo)
 
     def get_basin_score(self):
-        low_points = [(x, y) for x, y, _, is_lo in self.iter_cells() if is_lo]
-        basin_sizes = [self.get_basin_size(x, y) for x, y in low_points]
+        low_points = [i for i, _, is_lo in self.iter_cells() if is_lo]
+        basin_sizes = [self.get_basin_size(i) for i in low_points]
         basin_sizes.sort(reverse=True)
         return basin_sizes[0] * basin_sizes[1] * basin_sizes[2]
 
     def __str__(self):
         rows = [[] for _ in range(self.height)]
-        for _, y, value, is_low_point in self.iter_cells():
+        for i, value, is_low_point in self.iter_cells():
+            _, y = self.grid.coords(i)
             rows[y].append(f"[{value}]" if is_low_point else f" {value} ")
         return "\n".join("".join(r) for r in rows)
 
 
 def read_input(s):
-    rows = []
-    for line in s.splitlines():
-        rows.append([int(c) for c in line])
-    return Map(rows)
+    return Map(Grid.from_digits(s))
 
 
-def main():
+def part1(m):
+    return m.get_risk_score()
+
+
+def part2(m):
+    return m.get_basin_score()
+
+
+def solve(s):
+    return part1(read_input(s)), part2(read_input(s))
+
+
+def check():
+    from textwrap import dedent
+
     example = dedent("""\
     2199943210
     3987894921
@@ -75,14 +88,18 @@ def main():
     assert m.get_risk_score() == 15
     assert m.get_basin_score() == 1134
 
+
+def main():
+    check()
+
     with open("input.txt") as f:
         m = read_input(f.read())
 
     print("part 1")
-    print(m.get_risk_score())
+    print(part1(m))
 
     print("part 2")
-    print(m.get_basin_score())
+    print(part2(m))
 
 
 if __name__ == "__main__":